@@ -23,8 +23,8 @@ class RTS2LogFormatter(logging.Formatter):
         }
 
         # Get the device name from the Device singleton if available
-        from rtspy.core.device import Device
-        device = Device.get_instance()
+        from rtspy.core.device import get_device
+        device = get_device()
         device_name = getattr(device, 'device_name', 'UNKNOWN') if device else 'UNKNOWN'
 
         # Format timestamp in UTC
@@ -2,6 +2,10 @@ import logging
 from typing import List, Any, Tuple
 from rtspy.core.constants import ConnectionState, DevTypes
 
+# Returned by a handler that has started a long operation and will send the
+# reply itself when it completes; the network manager must not acknowledge it.
+DEFERRED_RESPONSE = object()
+
 class CommandRegistry:
     """
     A registry for command handlers that supports multiple handlers per command.
@@ -103,7 +107,7 @@ class CommandRegistry:
                 if result:
                     success_count += 1
 
-                logging.debug(f"Handler {handler.__class__.__name__} for '{command}': {result}")
+                logging.debug("Handler %s for '%s': %s", handler.__class__.__name__, command, result)
 
             except Exception as e:
                 logging.error(f"Error in {handler.__class__.__name__} handling command '{command}': {e}", exc_info=True)
@@ -231,7 +235,7 @@ class ProtocolCommands:
         """
         parts = params.split(maxsplit=3 if is_bop else 2)
 
-        logging.debug(f"S/B handler ({'B' if is_bop else 'S'}) {params}")
+        logging.debug("S/B handler (%s) %s", 'B' if is_bop else 'S', params)
 
         if not parts:
             return False
@@ -241,6 +245,7 @@ class ProtocolCommands:
         status_msg = ""
 
         message_idx = 1
+        old_bop_state = conn.bop_state
         # For BOP commands, also extract BOP state
         if is_bop:
             if len(parts) < 2:
@@ -279,10 +284,13 @@ class ProtocolCommands:
         # Check if any component has registered interest in this device's state
         device_name = conn.remote_device_name if hasattr(conn, 'remote_device_name') else self.network_manager._get_connection_entity_desc(conn)
         if hasattr(self.network_manager, 'state_interests') and device_name in self.network_manager.state_interests:
-            # Call the registered callback with appropriate parameters
-            self.network_manager.state_interests[device_name](
-                device_name, status_value, conn.bop_state, status_msg)
-            logging.debug(f"Dispatched {'BOP' if is_bop else 'state'} update for {device_name}")
+            # Interests limited to some BOP bits are skipped unless one of them flipped
+            bop_mask = self.network_manager.state_interest_masks.get(device_name)
+            if bop_mask is None or (old_bop_state ^ conn.bop_state) & bop_mask:
+                # Call the registered callback with appropriate parameters
+                self.network_manager.state_interests[device_name](
+                    device_name, status_value, conn.bop_state, status_msg)
+                logging.debug("Dispatched %s update for %s", 'BOP' if is_bop else 'state', device_name)
 
         # Status commands don't expect responses
         conn.command_in_progress = False
@@ -8,6 +8,7 @@ import time
 import errno
 import signal
 import fcntl
+import threading
 import math
 from dataclasses import dataclass
 
@@ -17,6 +18,15 @@ from rtspy.core.config import DeviceConfig
 from rtspy.core.constants import DeviceType
 
 
+# The running device (singleton), see get_device()
+_DEVICE_INSTANCE = None
+
+
+def get_device():
+    """Get the singleton device instance (None if no device was created yet)."""
+    return _DEVICE_INSTANCE
+
+
 class Device(DeviceConfig):
     """
     Base class for RTS2 devices with integrated NetworkManager and simple configuration.
@@ -25,8 +35,6 @@ class Device(DeviceConfig):
     to interact with the RTS2 network and handle configuration from multiple sources.
     """
 
-    _instance = None  # Singleton instance
-
     # RTS2 Device states
     STATE_IDLE = 0x000
     STATE_RUNNING = 0x001
@@ -93,8 +101,8 @@ class Device(DeviceConfig):
 
     @classmethod
     def get_instance(cls):
-        """Get the singleton device instance."""
-        return cls._instance
+        """Get the singleton device instance (kept for compatibility, see get_device)."""
+        return _DEVICE_INSTANCE
 
     def __init__(self, device_name, device_type, port=0):
         """Initialize the device."""
@@ -102,9 +110,10 @@ class Device(DeviceConfig):
         super().__init__()
 
         # Set singleton instance
-        if Device._instance is not None:
+        global _DEVICE_INSTANCE
+        if _DEVICE_INSTANCE is not None:
             logging.warning("Creating multiple Device instances is not recommended")
-        Device._instance = self
+        _DEVICE_INSTANCE = self
 
         if device_name is None:
             device_name = self.DEVICE_TYPE_DEFAULTS.get(device_type, f"DEV{device_type}")
@@ -129,6 +138,8 @@ class Device(DeviceConfig):
         # Initialize in IDLE state
         self._state = self.STATE_IDLE
         self._bop_state = 0
+        # Serializes state changes made from different threads
+        self._state_lock = threading.RLock()
 
         # Track expected progress times
         self.state_start = float('nan')
@@ -234,39 +245,52 @@ class Device(DeviceConfig):
             description: Optional text description of the state change
             new_bop: Optional BOP state to set (if None, BOP state remains unchanged)
         """
+        with self._state_lock:
+            self._set_state_locked(new_state, description, new_bop)
+
+        # Check queued values that might now be executable. This is done
+        # after releasing the state lock, as applying a queued value may
+        # take locks of its own (e.g. starting a filter move).
+        self.check_queued_values()
+
+        # Call user-defined state changed handler if state changed
+        #if old_state != new_state:
+        #    self.on_state_changed(old_state, new_state, description)
+
+    def mask_state(self, state_mask, new_state, description=None, new_bop=None):
+        """
+        Replace the state bits in state_mask with new_state.
+
+        Unlike set_state(self._state | ...), the read-modify-write is done
+        under the state lock, so bits changed concurrently by another
+        thread are not lost.
+        """
+        with self._state_lock:
+            self._set_state_locked((self._state & ~state_mask) | new_state, description, new_bop)
+        self.check_queued_values()
+
+    def _set_state_locked(self, new_state, description, new_bop):
+        """Update and propagate the state; called with the state lock held."""
         if new_bop is not None:
-            logging.info(f"Device.set_state(0x{new_state:x}, 0x{new_bop:x}, '{description}')")
+            logging.info("Device.set_state(0x%x, 0x%x, '%s')", new_state, new_bop, description)
         else:
-            logging.info(f"Device.set_state(0x{new_state:x}, -, '{description}')")
-
-        # Store old states for notifications
-        old_state = self._state
+            logging.info("Device.set_state(0x%x, -, '%s')", new_state, description)
 
         # Update internal state
         self._state = new_state
 
-        # Process any queued values first - these will be sent immediately
-        # This ensures all value changes happen before state changes
-        self.check_queued_values()
-
         # Update BOP state if provided
         if new_bop is not None:
-            self.set_full_bop_state(new_bop)  # This will handle BOP state changes
+            self._set_bop_state(new_bop)  # This will handle BOP state changes
         else:
             # Only state changed - use S command
             self.network.set_device_state(new_state, description)
 
-        # Check queued values that might now be executable
-        self.check_queued_values()
-
-        # Call user-defined state changed handler if state changed
-        #if old_state != new_state:
-        #    self.on_state_changed(old_state, new_state, description)
-
     def set_ready(self, message="Device ready"):
         """Set device ready."""
-        if self._state & self.NOT_READY:
-            self.set_state(self._state & ~self.NOT_READY, message)
+        state = self._state
+        if state & Device.NOT_READY:
+            self.set_state(state & _CLEAR_NOT_READY, message)
 
     def set_full_bop_state(self, new_bop_state):
         """
@@ -275,27 +299,31 @@ class Device(DeviceConfig):
         This is a special state used for coordinating operations between
         different devices in RTS2.
         """
+        with self._state_lock:
+            changed = self._set_bop_state(new_bop_state)
+
+        # Check queued values now that BOP state has changed
+        if changed:
+            self.check_queued_values()
+
+    def _set_bop_state(self, new_bop_state):
+        """Update and propagate the BOP state; returns False if unchanged."""
         # Skip if BOP state hasn't changed
         if self._bop_state == new_bop_state:
-            return
+            return False
 
         # Adjust BOP state for queued values
-        for value, op, new_value in self.queued_values.values():
-            if hasattr(self, 'mask_que_value_bop_state'):
-                new_bop_state = self.mask_que_value_bop_state(new_bop_state, value.get_que_condition())
-
-        # Store old state values
-        old_state = self._state
-        old_bop = self._bop_state
+        mask_que_value_bop_state = getattr(self, 'mask_que_value_bop_state', None)
+        if mask_que_value_bop_state is not None and self.queued_values:
+            for value, op, new_value in self.queued_values.values():
+                new_bop_state = mask_que_value_bop_state(new_bop_state, value.get_que_condition())
 
         # Update internal BOP state
         self._bop_state = new_bop_state
 
         # Propagate to network - use B command for combined state + BOP update
         self.network.set_bop_state(self._state, new_bop_state)
-
-        # Check queued values now that BOP state has changed
-        self.check_queued_values()
+        return True
 
     def register_value(self, value):
         """Register a value with the device."""
@@ -311,6 +339,17 @@ class Device(DeviceConfig):
             self.network.broadcast_value(value)
             value.reset_need_send()
 
+    def _distribute_values(self, values):
+        """Distribute several values to all connections, one write per connection."""
+        values = [value for value in values if value.need_send()]
+        if len(values) == 1:
+            self.network.broadcast_value(values[0])
+        elif values:
+            self.network.broadcast_values(values)
+
+        for value in values:
+            value.reset_need_send()
+
     def connect_to_centrald(self, host, port):
         """Connect to a centrald server."""
         return self.network.connect_to_centrald(host, port)
@@ -333,24 +372,29 @@ class Device(DeviceConfig):
 
     def check_queued_values(self):
         """Check queued values that may now be executable."""
-        # Process all queued values
-        keys_to_remove = []
+        if not self.queued_values:
+            return
+
+        # Process a snapshot of the queue, so callbacks fired by changed()
+        # may queue further values without breaking the iteration; the
+        # released values are broadcast together afterwards
+        released = []
+        try:
+            for key, (value, op, new_value) in list(self.queued_values.items()):
+                # Check if we can apply the change now
+                if self.should_queue_value(value):
+                    continue
 
-        for key, (value, op, new_value) in self.queued_values.items():
-            # Check if we can apply the change now
-            if not self.should_queue_value(value):
                 # Apply the change
                 try:
                     value._value = new_value
                     value.changed()
-                    self.distribute_value(value)
-                    keys_to_remove.append(key)
+                    released.append(value)
+                    self.queued_values.pop(key, None)
                 except Exception as e:
                     logging.error(f"Error updating queued value {value.name}: {e}")
-
-        # Remove processed values
-        for key in keys_to_remove:
-            del self.queued_values[key]
+        finally:
+            self._distribute_values(released)
 
     def _handle_info_command(self, conn, params):
         """Handle 'info' command."""
@@ -419,6 +463,10 @@ class Device(DeviceConfig):
         """
         pass
 
+# Precomputed 32-bit mask for clearing the NOT_READY bit
+_CLEAR_NOT_READY = 0xFFFFFFFF ^ Device.NOT_READY
+
+
 class DeviceCommands:
     """
     Handler for device-related commands (info, base_info, etc.).
@@ -426,38 +474,33 @@ class DeviceCommands:
     This class handles all commands related to device information and status.
     """
 
+    __slots__ = ('network', '_dispatch')
+
     def __init__(self, network_manager):
         self.network = network_manager
-        # Map of command -> handler method
-        self.handlers = {
-            "info": self.handle_info,
-            "base_info": self.handle_base_info,
-            "device_status": self.handle_device_status
-        }
-        # Commands that need responses
-        self.needs_response = {
-            "info": True,
-            "base_info": True,
-            "device_status": True
+        # Map of command -> (handler method, needs response)
+        self._dispatch = {
+            "info": (self.handle_info, True),
+            "base_info": (self.handle_base_info, True),
+            "device_status": (self.handle_device_status, True)
         }
 
     def get_commands(self):
         """Get the list of commands this handler can process."""
-        return list(self.handlers.keys())
+        return list(self._dispatch.keys())
 
     def can_handle(self, command):
         """Check if this handler can process a command."""
-        return command in self.handlers
+        return command in self._dispatch
 
     def needs_response_for(self, command):
         """Check if a command needs a response."""
-        return self.needs_response.get(command, True)
+        return self._dispatch.get(command, (None, True))[1]
 
     def handle(self, command, conn, params):
         """Dispatch to the appropriate handler method."""
-        if command in self.handlers:
-            return self.handlers[command](conn, params)
-        return False
+        entry = self._dispatch.get(command)
+        return entry[0](conn, params) if entry else False
 
     def handle_info(self, conn, params):
         """Handle 'info' command."""
@@ -467,7 +510,7 @@ class DeviceCommands:
                 self.network.info_callback()
 
             self.network.values['infotime']._value = time.time()
-            logging.debug(f"DeviceCommands::handle_info() network.values:{self.network.values}")
+            logging.debug("DeviceCommands::handle_info() %d values", len(self.network.values))
 
             # Send all values
             with self.network._lock:
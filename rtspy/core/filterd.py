@@ -9,11 +9,14 @@ for multi-function devices.
 
 import time
 import logging
+import functools
+import threading
 from typing import Dict, Any, List, Optional
 from abc import ABC, abstractmethod
 
 from rtspy.core.device import Device
 from rtspy.core.config import DeviceConfig
+from rtspy.core.commands import DEFERRED_RESPONSE
 from rtspy.core.constants import DeviceType
 from rtspy.core.value import ValueSelection, ValueInteger, ValueString, ValueTime
 
@@ -32,6 +35,12 @@ class FilterMixin(DeviceConfig):
     FILTERD_IDLE = 0x000
     FILTERD_MOVE = 0x002
 
+    # Default minimum time between hardware position reads while the wheel is idle [s]
+    FILTER_POLL_INTERVAL = 1.0
+
+    # Default time a filter move may take before it is considered failed [s]
+    FILTER_MOVE_TIMEOUT = 60.0
+
     def setup_filter_config(self, config):
         """Register filter wheel-specific configuration arguments."""
         config.add_argument('-F', '--filters',
@@ -40,28 +49,35 @@ class FilterMixin(DeviceConfig):
                           help='Default filter', default=0)
         config.add_argument('--daytime-filter',
                           help='Daytime filter', default=0)
+        config.add_argument('--filter-poll-interval', type=float, default=self.FILTER_POLL_INTERVAL,
+                          help='Minimum time between filter position reads while idle [s]')
+        config.add_argument('--filter-move-timeout', type=float, default=self.FILTER_MOVE_TIMEOUT,
+                          help='Time after which an unfinished filter move is an error [s]')
 
     def apply_filter_config(self, config: Dict[str, Any]):
         """Apply filter wheel-specific configuration."""
         # Process filters string
         filters_str = config.get('filters', 'J:H:K')  # default
-        self.filter = ValueSelection("filter", "used filter", writable=True)
+        self.filter = self._filter_selection('filter', "filter", "used filter")
         self.set_filters(self.filter, filters_str)
 
-        # Default and daytime filters
-        self.default_filter = None
+        # Default and daytime filters - values are only created when requested,
+        # and reused if the configuration is applied again
         default_filter_arg = config.get('default_filter')
         if default_filter_arg:
-            self.default_filter = ValueSelection("def_filter", "default filter", writable=True)
+            self.default_filter = self._filter_selection('default_filter', "def_filter", "default filter")
             self.set_filters(self.default_filter, filters_str)
             self.default_filter.set_value_char_arr(default_filter_arg)
+        elif not hasattr(self, 'default_filter'):
+            self.default_filter = None
 
-        self.arg_default_filter = None
         daytime_filter_arg = config.get('daytime_filter')
         if daytime_filter_arg:
-            self.daytime_filter = ValueSelection("day_filter", "daytime filter", writable=True)
+            self.daytime_filter = self._filter_selection('daytime_filter', "day_filter", "daytime filter")
             self.set_filters(self.daytime_filter, filters_str)
             self.daytime_filter.set_value_char_arr(daytime_filter_arg)
+        elif not hasattr(self, 'daytime_filter'):
+            self.daytime_filter = None
 
         # CCD integration
         self.associated_ccd = None
@@ -69,18 +85,43 @@ class FilterMixin(DeviceConfig):
 
         # Movement state
         self.pending_filter_connection = None
+        self.pending_filter_home_connection = None
         self.movement_in_progress = False
         self._movement_start_time = None
         self._target_filter = None
+        self._movement_deadline = None
+        self._movement_watchdog = None
+        self._filter_move_timeout = config.get('filter_move_timeout', self.FILTER_MOVE_TIMEOUT)
+        self._last_filter_poll = float('-inf')
+        self._filter_poll_interval = config.get('filter_poll_interval', self.FILTER_POLL_INTERVAL)
+        # Serializes starting and completing moves, which run on different
+        # threads; the thread-local flag marks a move being started
+        self._filter_lock = threading.RLock()
+        self._filter_transition = threading.local()
 
         # Store arguments for later processing
         self.arg_default_filter = config.get('default_filter')
         self.arg_daytime_filter = config.get('daytime_filter')
 
+    def _filter_selection(self, attr, name, description):
+        """Return the selection value stored in attr, creating it on first use."""
+        selection = getattr(self, attr, None)
+        if selection is None:
+            selection = ValueSelection(name, description, writable=True)
+        return selection
+
     def is_filter_moving(self) -> bool:
         """Check if filter wheel is currently moving."""
         return bool(self._state & self.FILTERD_MOVE)
 
+    def enter_filter_move(self, message):
+        """Set the filter moving state, blocking exposures."""
+        self.mask_state(self.FILTERD_MOVE, self.FILTERD_MOVE, message, self.BOP_EXPOSURE)
+
+    def exit_filter_move(self, message="Filter wheel idle"):
+        """Clear the filter moving state."""
+        self.mask_state(self.FILTERD_MOVE, 0, message, 0)
+
     def on_value_changed_from_client(self, value, old_value, new_value):
         """Handle value changes from network clients."""
         try:
@@ -105,10 +146,65 @@ class FilterMixin(DeviceConfig):
 
     def filter_info_update(self):
         """Update filter information from hardware."""
+        # During a move the hardware position is stale or invalid, and the
+        # move ends through movement_completed(); nothing to read then
+        if self.movement_in_progress:
+            self._check_filter_move_timeout()
+            return
+
+        # While idle the position only changes through movement_completed(),
+        # so the hardware is not re-read more often than the poll interval
+        now = time.monotonic()
+        if now - self._last_filter_poll < self._filter_poll_interval:
+            return
+        self._last_filter_poll = now
+
         # Update filter position from hardware
-        current_filter = self.get_filter_num()
-        if current_filter != self.filter.value:
-            self.filter.value = current_filter
+        with self._filter_lock:
+            current_filter = self.get_filter_num()
+            if current_filter != self.filter.value:
+                self.filter.value = current_filter
+
+    def _check_filter_move_timeout(self):
+        """Fail the current move if it overran the move timeout."""
+        deadline = self._movement_deadline
+        if deadline is None or time.monotonic() < deadline:
+            return
+        self._filter_move_timed_out(deadline)
+
+    def _start_movement_watchdog(self):
+        """Fail the current move from a timer once its deadline has passed."""
+        # The timer only fails the move it was started for
+        watchdog = threading.Timer(self._filter_move_timeout, self._filter_move_timed_out,
+                                   args=(self._movement_deadline,))
+        watchdog.daemon = True
+        self._cancel_movement_watchdog()
+        self._movement_watchdog = watchdog
+        watchdog.start()
+
+    def _cancel_movement_watchdog(self):
+        """Stop the timer of the current move, if any."""
+        if self._movement_watchdog:
+            self._movement_watchdog.cancel()
+            self._movement_watchdog = None
+
+    def _filter_move_timed_out(self, deadline):
+        """Fail the move with the given deadline, unless it has ended already."""
+        with self._filter_lock:
+            if not self.movement_in_progress or self._movement_deadline != deadline:
+                return
+            self._movement_watchdog = None
+            logging.error("Filter move to #%s did not finish in %.1fs",
+                          self._target_filter, self._filter_move_timeout)
+            self.movement_in_progress = False
+            self._target_filter = None
+            self._movement_start_time = None
+            self._movement_deadline = None
+            self.mask_state(self.FILTERD_MOVE | self.ERROR_HW, self.ERROR_HW, "filter move timeout", 0)
+
+            if self.pending_filter_connection:
+                self.network._send_error_response(self.pending_filter_connection, "filter move timeout")
+                self.pending_filter_connection = None
 
     def script_ends_filter(self):
         """Called when a script ends - handle filter-specific cleanup."""
@@ -118,7 +214,7 @@ class FilterMixin(DeviceConfig):
 
     def on_filter_state_changed(self, old_state, new_state, message):
         """Handle device state changes for filter-specific logic."""
-        logging.debug(f"Filter state changed from {old_state:x} to {new_state:x}: {message}")
+        logging.debug("Filter state changed from %x to %x: %s", old_state, new_state, message)
 
         # Check for day/night transition
         # bullshit, this is in centrald state, not here and that would be done really differently
@@ -168,20 +264,35 @@ class FilterMixin(DeviceConfig):
 
     def set_filter_num_mask(self, new_filter):
         """Set filter with appropriate state masking."""
+        # Defensive reentrancy guard: a filter change requested on this
+        # thread from within the start of a move (e.g. by a state change
+        # handler) must not start a nested move
+        if getattr(self._filter_transition, 'active', False):
+            logging.warning("Ignoring move to filter #%s requested while starting a filter move", new_filter)
+            return -1
+
+        with self._filter_lock:
+            self._filter_transition.active = True
+            try:
+                return self._start_filter_move(new_filter)
+            finally:
+                self._filter_transition.active = False
+
+    def _start_filter_move(self, new_filter):
+        """Start a filter move; called with the filter lock held."""
+        filt = self.filter
+
         # Set device state to show filter is moving
-        self.set_state(
-            self._state | self.FILTERD_MOVE,
-            "filter move started",
-            self.BOP_EXPOSURE
-        )
+        self.enter_filter_move("filter move started")
 
         # Log movement
-        logging.info(f"moving filter from #{self.filter.value} ({self.filter.get_sel_name()}) "
-                    f"to #{new_filter} ({self.filter.get_sel_name(new_filter)})")
+        logging.info("moving filter from #%s (%s) to #%s (%s)",
+                     filt.value, filt.get_sel_name(), new_filter, filt.get_sel_name(new_filter))
 
         # Mark that movement is in progress
         self.movement_in_progress = True
         self._movement_start_time = time.time()
+        self._movement_deadline = time.monotonic() + self._filter_move_timeout
 
         # Actually move the filter
         ret = self.set_filter_num(new_filter)
@@ -189,37 +300,52 @@ class FilterMixin(DeviceConfig):
         if ret == 0:
             # Record the target filter (will be used for completion)
             self._target_filter = new_filter
+            # Fail the move if it does not complete in time, whether or
+            # not clients keep polling
+            if self.movement_in_progress:
+                self._start_movement_watchdog()
             # Do NOT update state or values yet - wait for movement completion
             # Return success to caller
             return ret
         else:
             # Error occurred
             self.movement_in_progress = False
+            self._movement_deadline = None
+            self._cancel_movement_watchdog()
             if ret == -1:
-                self.set_state(self._state | self.ERROR_HW, "filter movement failed", 0)
+                self.mask_state(self.ERROR_HW, self.ERROR_HW, "filter movement failed", 0)
             return ret
 
     def movement_completed(self):
         """Called when filter movement has completed."""
+        with self._filter_lock:
+            self._complete_filter_move()
+
+    def _complete_filter_move(self):
+        """Finish the current filter move; called with the filter lock held."""
         if not self.movement_in_progress:
             return
 
         # Update the filter value
-        if hasattr(self, '_target_filter') and self._target_filter is not None:
-            self.filter.value = self._target_filter
+        target = getattr(self, '_target_filter', None)
+        if target is not None:
+            self.filter.value = target
             self._target_filter = None
 
         # Record movement end time
-        if self._movement_start_time:
-            duration = time.time() - self._movement_start_time
-            logging.info(f"Filter movement completed in {duration:.1f}s to position {self.get_filter_num()}")
+        start_time = self._movement_start_time
+        if start_time:
+            logging.info("Filter movement completed in %.1fs to position %s",
+                         time.time() - start_time, self.get_filter_num())
             self._movement_start_time = None
 
         # Clear the movement flag
         self.movement_in_progress = False
+        self._movement_deadline = None
+        self._cancel_movement_watchdog()
 
         # Reset device state
-        self.set_state(self._state & ~(self.FILTERD_MOVE), "Filter wheel idle", 0)
+        self.exit_filter_move()
 
         # Send response to pending command if present
         if self.pending_filter_connection:
@@ -231,12 +357,35 @@ class FilterMixin(DeviceConfig):
         Home the filter wheel.
 
         Subclasses should override this for hardware implementations.
+        Homing that continues in the background returns 1 and is finished
+        with filter_homing_completed().
 
         Returns:
-            0 on success, -1 if not implemented
+            0 on success, 1 if homing was started, -1 if not implemented
         """
         return -1
 
+    def filter_homing_completed(self, error=None):
+        """
+        Finish homing started by home_filter().
+
+        Args:
+            error: None on success, otherwise the error message
+        """
+        if error is None:
+            self.exit_filter_move("Filter wheel homed")
+        else:
+            self.mask_state(self.FILTERD_MOVE | self.ERROR_HW, self.ERROR_HW, error, 0)
+
+        # Send response to pending command if present
+        conn = self.pending_filter_home_connection
+        self.pending_filter_home_connection = None
+        if conn:
+            if error is None:
+                self.network._send_ok_response(conn)
+            else:
+                self.network._send_error_response(conn, error)
+
     def set_filters(self, filter_selval, filters_str):
         """
         Set filter names from a string.
@@ -247,36 +396,17 @@ class FilterMixin(DeviceConfig):
         Returns:
             0 on success, -1 on error
         """
-        filter_list = []
-
-        # Split by colon, handling quotes
-        tf = filters_str
-
-        while tf:
-            # Skip leading spaces and separators
-            tf = tf.lstrip(':"\' ')
-            if not tf:
-                break
-
-            # Find end of filter name
-            pos = tf.find(':')
-            if pos == -1:
-                # Last filter
-                filter_list.append(tf)
-                break
-
-            # Add filter and continue
-            filter_list.append(tf[:pos])
-            tf = tf[pos+1:]
+        # Split by colon, dropping quotes, spaces and empty names
+        filter_list = [name for name in
+                       (tok.strip('"\' ') for tok in filters_str.split(':'))
+                       if name]
 
         # If no filters found, return error
         if not filter_list:
             return -1
 
-        # Clear and add all filters
-        filter_selval.clear_selection()
-        for f in filter_list:
-            filter_selval.add_sel_val(f)
+        # Replace all filters at once
+        filter_selval.set_selection(filter_list)
 
         return 0
 
@@ -313,9 +443,10 @@ class FilterMixin(DeviceConfig):
         """Set the associated CCD device for state monitoring."""
         self.associated_ccd = ccd_name
 
-        # Register interest in CCD state updates
-        self.network.register_state_interest(ccd_name, self._handle_ccd_state_update)
-        logging.debug(f"Registered interest in state updates from CCD device {ccd_name}")
+        # Register interest in CCD state updates - only exposure changes matter
+        self.network.register_state_interest(ccd_name, self._handle_ccd_state_update,
+                                             bop_mask=self.BOP_EXPOSURE)
+        logging.debug("Registered interest in state updates from CCD device %s", ccd_name)
 
     def _handle_ccd_state_update(self, device_name, state, bop_state, message):
         """Handle state updates from the associated CCD."""
@@ -325,7 +456,7 @@ class FilterMixin(DeviceConfig):
         # Only take action if exposure state has changed
         if ccd_exposing != self.ccd_exposing:
             self.ccd_exposing = ccd_exposing
-            logging.debug(f"CCD {device_name} exposure state changed to: {ccd_exposing}")
+            logging.debug("CCD %s exposure state changed to: %s", device_name, ccd_exposing)
 
             if ccd_exposing:
                 # CCD started exposing - ensure we don't move filter wheel
@@ -335,6 +466,23 @@ class FilterMixin(DeviceConfig):
                 # CCD finished exposing - filter wheel can move again
                 logging.debug("Filter wheel movement unblocked")
 
+
+def _with_error_response(handler):
+    """Log exceptions from a FilterCommands handler and answer them with an error response."""
+    command = handler.__name__[len("handle_"):]
+
+    @functools.wraps(handler)
+    def wrapper(self, conn, params):
+        try:
+            return handler(self, conn, params)
+        except Exception as e:
+            logging.error("Error handling %s command: %s", command, e)
+            self._send_error(conn, f"Error: {str(e)}")
+            return False
+
+    return wrapper
+
+
 class FilterCommands:
     """
     Handler for filter wheel-specific commands.
@@ -342,40 +490,34 @@ class FilterCommands:
 
     def __init__(self, filter_device):
         self.filter_device = filter_device
+        self._send_ok = filter_device.network._send_ok_response
+        self._send_error = filter_device.network._send_error_response
         # Map of command -> handler method
-        self.handlers = {
+        self._dispatch = {
             "filter": self.handle_filter,
             "home": self.handle_home,
             "killall": self.handle_killall,
             "killall_wse": self.handle_killall_wse,
             "script_ends": self.handle_script_ends
         }
-        # Commands that need responses
-        self.needs_response = {
-            "filter": True,
-            "home": True,
-            "killall": True,
-            "killall_wse": True,
-            "script_ends": True
-        }
+        self._commands = tuple(self._dispatch)
 
     def get_commands(self):
-        """Get the list of commands this handler can process."""
-        return list(self.handlers.keys())
+        """Get the commands this handler can process."""
+        return self._commands
 
     def can_handle(self, command):
         """Check if this handler can process a command."""
-        return command in self.handlers
+        return command in self._dispatch
 
     def needs_response_for(self, command):
-        """Check if a command needs a response."""
-        return self.needs_response.get(command, True)
+        """Check if a command needs a response (all filter commands do)."""
+        return True
 
     def handle(self, command, conn, params):
         """Dispatch to the appropriate handler method."""
-        if command in self.handlers:
-            return self.handlers[command](conn, params)
-        return False
+        handler = self._dispatch.get(command)
+        return handler(conn, params) if handler else False
 
     def handle_filter(self, conn, params):
         """Handle 'filter' command to set filter wheel position."""
@@ -385,8 +527,7 @@ class FilterCommands:
 
             # Check if filter number is valid
             if filter_num < 0 or filter_num >= self.filter_device.filter.sel_size():
-                self.filter_device.network._send_error_response(
-                    conn, f"Invalid filter number: {filter_num}")
+                self._send_error(conn, f"Invalid filter number: {filter_num}")
                 return False
 
             # Set filter - don't complete the command until movement is done
@@ -398,106 +539,89 @@ class FilterCommands:
 
             if ret != 0:
                 # Error - send error response immediately
-                self.filter_device.network._send_error_response(
-                    conn, f"Error setting filter to position {filter_num}")
+                self._send_error(conn, f"Error setting filter to position {filter_num}")
                 self.filter_device.pending_filter_connection = None
                 return False
 
             # No response sent yet - it will be sent when movement completes
-            return True
+            return DEFERRED_RESPONSE
 
         except ValueError:
-            self.filter_device.network._send_error_response(
-                conn, f"Invalid filter number: {params}")
+            self._send_error(conn, f"Invalid filter number: {params}")
             return False
 
+    @_with_error_response
     def handle_home(self, conn, params):
         """Handle 'home' command to home the filter wheel."""
-        try:
-            # Call home_filter method on the device
-            ret = self.filter_device.home_filter()
-
-            if ret == 0:
-                # Success
-                self.filter_device.network._send_ok_response(conn)
-                return True
-            elif ret == -1:
-                # Not implemented
-                self.filter_device.network._send_error_response(
-                    conn, "Home operation not implemented for this filter wheel")
-                return False
-            else:
-                # Other error
-                self.filter_device.network._send_error_response(
-                    conn, f"Error homing filter wheel")
-                return False
+        # Store the connection to respond to if homing completes later
+        self.filter_device.pending_filter_home_connection = conn
 
-        except Exception as e:
-            logging.error(f"Error handling home command: {e}")
-            self.filter_device.network._send_error_response(conn, f"Error: {str(e)}")
+        # Call home_filter method on the device
+        ret = self.filter_device.home_filter()
+
+        if ret > 0:
+            # No response sent yet - it will be sent when homing completes
+            return DEFERRED_RESPONSE
+
+        self.filter_device.pending_filter_home_connection = None
+        if ret == 0:
+            # Success
+            self._send_ok(conn)
+            return True
+        elif ret == -1:
+            # Not implemented
+            self._send_error(conn, "Home operation not implemented for this filter wheel")
+            return False
+        else:
+            # Other error
+            self._send_error(conn, "Error homing filter wheel")
             return False
 
+    @_with_error_response
     def handle_killall(self, conn, params):
         """Handle 'killall' command to reset all errors and end scripts."""
-        try:
-            # Clear any error states
-            self.filter_device.set_state(
-                self.filter_device._state & ~self.filter_device.ERROR_MASK,
-                "Errors cleared by killall"
-            )
-
-            # Call script_ends to perform any cleanup
-            if hasattr(self.filter_device, 'script_ends_filter'):
-                self.filter_device.script_ends_filter()
-
-            # Send OK response
-            self.filter_device.network._send_ok_response(conn)
-            return True
+        # Clear any error states
+        self.filter_device.set_state(
+            self.filter_device._state & ~self.filter_device.ERROR_MASK,
+            "Errors cleared by killall"
+        )
 
-        except Exception as e:
-            logging.error(f"Error handling killall command: {e}")
-            self.filter_device.network._send_error_response(conn, f"Error: {str(e)}")
-            return False
+        # Call script_ends to perform any cleanup
+        if hasattr(self.filter_device, 'script_ends_filter'):
+            self.filter_device.script_ends_filter()
 
+        # Send OK response
+        self._send_ok(conn)
+        return True
+
+    @_with_error_response
     def handle_killall_wse(self, conn, params):
         """Handle 'killall_wse' command to reset errors without calling script_ends."""
-        try:
-            # Clear any error states without calling script_ends
-            self.filter_device.set_state(
-                self.filter_device._state & ~self.filter_device.ERROR_MASK,
-                "Errors cleared by killall_wse"
-            )
-
-            # Send OK response
-            self.filter_device.network._send_ok_response(conn)
-            return True
+        # Clear any error states without calling script_ends
+        self.filter_device.set_state(
+            self.filter_device._state & ~self.filter_device.ERROR_MASK,
+            "Errors cleared by killall_wse"
+        )
 
-        except Exception as e:
-            logging.error(f"Error handling killall_wse command: {e}")
-            self.filter_device.network._send_error_response(conn, f"Error: {str(e)}")
-            return False
+        # Send OK response
+        self._send_ok(conn)
+        return True
 
+    @_with_error_response
     def handle_script_ends(self, conn, params):
         """Handle 'script_ends' command to notify device that script execution has ended."""
-        try:
-            # Call script_ends method on the device
-            ret = 0
-            if hasattr(self.filter_device, 'script_ends_filter'):
-                ret = self.filter_device.script_ends_filter()
-
-            if ret == 0:
-                # Success
-                self.filter_device.network._send_ok_response(conn)
-                return True
-            else:
-                # Error
-                self.filter_device.network._send_error_response(
-                    conn, f"Error in script_ends handler")
-                return False
+        # Call script_ends method on the device
+        ret = 0
+        if hasattr(self.filter_device, 'script_ends_filter'):
+            ret = self.filter_device.script_ends_filter()
 
-        except Exception as e:
-            logging.error(f"Error handling script_ends command: {e}")
-            self.filter_device.network._send_error_response(conn, f"Error: {str(e)}")
+        if ret == 0:
+            # Success
+            self._send_ok(conn)
+            return True
+        else:
+            # Error
+            self._send_error(conn, "Error in script_ends handler")
             return False
 
 
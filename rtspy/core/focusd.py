@@ -18,6 +18,7 @@ from abc import ABC, abstractmethod
 
 from rtspy.core.device import Device
 from rtspy.core.config import DeviceConfig
+from rtspy.core.commands import DEFERRED_RESPONSE
 from rtspy.core.constants import DeviceType
 from rtspy.core.value import ValueDouble, ValueBool, ValueString, ValueInteger, ValueSelection
 
@@ -120,6 +121,7 @@ class FocuserMixin(DeviceConfig):
         self._target_position = None
         self._movement_in_progress = False
         self.pending_focus_connection = None
+        self.pending_focus_home_connection = None
 
         # Initialize default values
         self.foc_pos.value = 0.0
@@ -387,6 +389,27 @@ class FocuserMixin(DeviceConfig):
         logging.info(f"Focuser moved to {current_pos}")
         return 0
 
+    def focuser_homing_completed(self, error=None):
+        """
+        Finish homing that home_focuser() started (returned 1).
+
+        Args:
+            error: None on success, otherwise the error message
+        """
+        if error is None:
+            self.mask_state(self.FOC_FOCUSING, 0, "Focuser homed", 0)
+        else:
+            self.mask_state(self.FOC_FOCUSING | self.ERROR_HW, self.ERROR_HW, error, 0)
+
+        # Send response to pending command if present
+        conn = self.pending_focus_home_connection
+        self.pending_focus_home_connection = None
+        if conn:
+            if error is None:
+                self.network._send_ok_response(conn)
+            else:
+                self.network._send_error_response(conn, error)
+
     def script_ends_focuser(self):
         """Called when script ends - reset temporary offset."""
         if hasattr(self, 'foc_toff'):
@@ -609,7 +632,7 @@ class FocuserCommands:
                 return False
 
             # No response sent yet - it will be sent when movement completes
-            return True
+            return DEFERRED_RESPONSE
 
         except ValueError:
             self.focuser_device.network._send_error_response(
@@ -640,7 +663,7 @@ class FocuserCommands:
                 return False
 
             # No response sent yet - it will be sent when movement completes
-            return True
+            return DEFERRED_RESPONSE
 
         except ValueError:
             self.focuser_device.network._send_error_response(
@@ -656,9 +679,17 @@ class FocuserCommands:
                     conn, "Home operation not implemented for this focuser")
                 return False
 
+            # Store the connection to respond to if homing completes later
+            self.focuser_device.pending_focus_home_connection = conn
+
             # Call home_focuser method on the device
             ret = self.focuser_device.home_focuser()
 
+            if ret > 0:
+                # No response sent yet - it will be sent when homing completes
+                return DEFERRED_RESPONSE
+
+            self.focuser_device.pending_focus_home_connection = None
             if ret == 0:
                 # Success
                 self.focuser_device.network._send_ok_response(conn)
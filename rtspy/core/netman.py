@@ -12,7 +12,7 @@ import fcntl
 
 from rtspy.core.constants import ConnectionState, DeviceType, DevTypes
 from rtspy.core.connection import Connection, ConnectionManager, QueuedCommand
-from rtspy.core.commands import CommandRegistry, ProtocolCommands, AuthCommands
+from rtspy.core.commands import CommandRegistry, ProtocolCommands, AuthCommands, DEFERRED_RESPONSE
 
 class NetworkManager:
     """
@@ -80,6 +80,7 @@ class NetworkManager:
         # Interest tracking
         self.value_interests = {}  # "device_name.value_name" -> callback
         self.state_interests = {}  # device_name -> callback
+        self.state_interest_masks = {}  # device_name -> BOP mask the callback is limited to
         self.connection_state_callbacks = {}  # device_name -> callback(device_name, connected: bool)
         self.pending_interests = set()  # Set of device names we're interested in
         self.device_connection_attempts = {}  # device_name -> (last_attempt_time, retry_count, last_error_logged_time)
@@ -537,6 +538,9 @@ class NetworkManager:
         elif msg_type == 'broadcast_value':
             value = args[0]
             self._handle_broadcast_value(value)
+        elif msg_type == 'broadcast_values':
+            values = args[0]
+            self._handle_broadcast_values(values)
 
     def _handle_command(self, conn_id, line):
         """Handle a command from a connection."""
@@ -551,7 +555,7 @@ class NetworkManager:
         cmd = parts[0] if parts else ""
         params = parts[1] if len(parts) > 1 else ""
 
-        logging.debug(f"ICMD {conn.name}: '{cmd}', Params: '{params}'")
+        logging.debug("ICMD %s: '%s', Params: '%s'", conn.name, cmd, params)
 
         # Special handling for this_device command - identifies device connections
         if cmd == "this_device":
@@ -563,7 +567,7 @@ class NetworkManager:
 
         # If it's not an immediate command and another command is in progress, queue it
         if not is_immediate_command and conn.command_in_progress:
-            logging.debug(f"Command {cmd} queued - another command is in progress")
+            logging.debug("Command %s queued - another command is in progress", cmd)
             conn.command_queue.put(QueuedCommand(f"{cmd} {params}"))
             return
 
@@ -581,7 +585,10 @@ class NetworkManager:
 
                 if needs_response:
                     if success:
-                        if isinstance(result, bool):
+                        if result is DEFERRED_RESPONSE:
+                            # Handler replies when the operation completes
+                            pass
+                        elif isinstance(result, bool):
                             if result:
                                 self._send_ok_response(conn)
                             else:
@@ -648,7 +655,7 @@ class NetworkManager:
     def _process_next_command(self, conn, cmd, params):
         """Process the next command from the queue."""
         conn.command_in_progress = True
-        logging.debug(f"Processing queued command for {conn.name}: {cmd}")
+        logging.debug("Processing queued command for %s: %s", conn.name, cmd)
         self._handle_command(conn.id, f"{cmd} {params}".strip())
 
     def connect_to_centrald(self, host, port):
@@ -791,10 +798,14 @@ class NetworkManager:
             logging.error(f"Registration failed: {msg}")
             conn.update_state(ConnectionState.BROKEN, f"{msg}")
 
+    @staticmethod
+    def _format_value(value):
+        """Return the protocol line announcing a value."""
+        return f"V {value.name} {value.get_string_value()}\n"
+
     def _send_value(self, conn, value):
         """Send a value to a connection."""
-        msg = f"V {value.name} {value.get_string_value()}\n"
-        conn.send(msg)
+        conn.send(self._format_value(value))
 
     def _handle_send_value(self, value, conn_id):
         """Send a value to a specific connection."""
@@ -811,6 +822,17 @@ class NetworkManager:
         for conn in auth_conns.values():
             self._send_value(conn, value)
 
+    def _handle_broadcast_values(self, values):
+        """Broadcast several values to all authenticated connections in one write each."""
+        msg = "".join(map(self._format_value, values))
+
+        # Get all authenticated connections
+        auth_conns = self.connection_manager.get_connections_by_state(ConnectionState.AUTH_OK)
+
+        # Send the whole batch to each connection
+        for conn in auth_conns.values():
+            conn.send(msg)
+
     def register_value(self, value):
         """Register a value for network distribution."""
         with self._lock:
@@ -827,6 +849,11 @@ class NetworkManager:
         # Queue for processing
         self.put_message(('broadcast_value', value))
 
+    def broadcast_values(self, values):
+        """Broadcast a batch of values to all connections."""
+        # Queue for processing
+        self.put_message(('broadcast_values', list(values)))
+
     def send_value_to(self, value, conn_id):
         """Send a value to a specific connection."""
         # Queue for processing
@@ -1100,18 +1127,24 @@ class NetworkManager:
         if not device_connected:
             logging.info(f"No connection to {device_name} yet - waiting for centrald updates")
 
-    def register_state_interest(self, device_name, state_callback):
+    def register_state_interest(self, device_name, state_callback, bop_mask=None):
         """
         Register interest in state updates from a specific device.
 
         Args:
             device_name: Name of the device to monitor
             state_callback: Callback function(device_name, state, bop_state, message)
+            bop_mask: If given, the callback is only called when one of these
+                      BOP bits changes (the initial cached state is always sent)
         """
         if not hasattr(self, 'state_interests'):
             self.state_interests = {}
 
         self.state_interests[device_name] = state_callback
+        if bop_mask is None:
+            self.state_interest_masks.pop(device_name, None)
+        else:
+            self.state_interest_masks[device_name] = bop_mask
         logging.debug(f"Registered interest in state updates from {device_name}")
 
         # Add to pending interests to ensure connection is established
@@ -1226,8 +1259,7 @@ class NetworkManager:
         # Send raw value message to each connection directly
         for conn in auth_conns.values():
             try:
-                msg = f"V {value.name} {value.get_string_value()}\n"
-                conn.send(msg)
+                conn.send(self._format_value(value))
             except Exception as e:
                 logging.error(f"Error sending immediate value to {conn.name}: {e}")
 
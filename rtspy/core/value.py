@@ -125,8 +125,8 @@ class Value(Generic[T]):
         self._callbacks = Callback()
 
         # Register with device for network and queuing
-        from rtspy.core.device import Device
-        device = Device.get_instance()  # Singleton device
+        from rtspy.core.device import get_device
+        device = get_device()  # Singleton device
 
         # immediately register the value for network distribution
         # (we may assume there is no point in having a Value not in the network)
@@ -160,8 +160,8 @@ class Value(Generic[T]):
             True if value was set immediately, False if it was queued
         """
         # Get singleton device
-        from rtspy.core.device import Device
-        device = Device.get_instance()
+        from rtspy.core.device import get_device
+        device = get_device()
 
         # Check if we should queue (only for non-network updates)
         if not from_network and device and device.should_queue_value(self):
@@ -221,8 +221,8 @@ class Value(Generic[T]):
             self._callbacks.trigger(self, old_value, new_value, from_client=True)
 
             # Get device instance to notify about value change
-            from rtspy.core.device import Device
-            device = Device.get_instance()
+            from rtspy.core.device import get_device
+            device = get_device()
             if device:
                 # Notify device about client-originated value change
                 device.on_value_changed_from_client(self, old_value, new_value)
@@ -712,6 +712,7 @@ class ValueSelection(Value[int]):
         super().__init__(name, description, write_to_fits, flags, ValueType.SELECTION, writable=writable)
         self._value = initial if initial is not None else 0
         self._selection_values = []  # List of string values
+        self._selection_index = {}  # Selection name -> first index
 
     def _convert_value(self, value: Any) -> int:
         """Convert value to integer index."""
@@ -725,10 +726,10 @@ class ValueSelection(Value[int]):
                 return int(value)
             except ValueError:
                 # Not a number, try to find it in selections
-                try:
-                    return self._selection_values.index(value)
-                except ValueError:
+                index = self._selection_index.get(value)
+                if index is None:
                     raise ValueError(f"Invalid selection value: {value}")
+                return index
 
         # Otherwise convert to integer
         return int(value)
@@ -753,19 +754,32 @@ class ValueSelection(Value[int]):
 
     def get_sel_index(self, name: str) -> int:
         """Get the index for a selection name."""
-        try:
-            return self._selection_values.index(name)
-        except ValueError:
-            return -1
+        return self._selection_index.get(name, -1)
+
+    def _reindex_selection(self) -> None:
+        """Rebuild the name -> index lookup after the selection changed."""
+        index = {}
+        for i, name in enumerate(self._selection_values):
+            index.setdefault(name, i)
+        self._selection_index = index
 
     def add_sel_val(self, value: str) -> None:
         """Add a selection value."""
+        self._selection_index.setdefault(value, len(self._selection_values))
         self._selection_values.append(value)
         self.changed()
 
     def clear_selection(self) -> None:
         """Clear all selection values."""
         self._selection_values.clear()
+        self._selection_index.clear()
+        self._value = 0
+        self.changed()
+
+    def set_selection(self, values: List[str]) -> None:
+        """Replace all selection values at once."""
+        self._selection_values = list(values)
+        self._reindex_selection()
         self._value = 0
         self.changed()
 
@@ -780,13 +794,11 @@ class ValueSelection(Value[int]):
                 return 0
         except ValueError:
             # Try to set as name
-            try:
-                index = self._selection_values.index(value)
+            index = self._selection_index.get(value)
+            if index is not None:
                 self._value = index
                 self.changed()
                 return 0
-            except ValueError:
-                pass
 
         # Value not found
         return -1
@@ -794,6 +806,7 @@ class ValueSelection(Value[int]):
     def copy_sel(self, other_selection: 'ValueSelection') -> None:
         """Copy selection options from another ValueSelection."""
         self._selection_values = other_selection._selection_values.copy()
+        self._selection_index = other_selection._selection_index.copy()
         self.changed()
 
     def sel_size(self) -> int:
@@ -821,8 +834,8 @@ class ValueSelection(Value[int]):
             self.changed()
 
             # Get device instance to notify about value change
-            from rtspy.core.device import Device
-            device = Device.get_instance()
+            from rtspy.core.device import get_device
+            device = get_device()
             if device:
                 # Notify device about client-originated value change
                 device.on_value_changed_from_client(self, old_value, new_value)
@@ -35,6 +35,14 @@ class DummyFilter(Filterd):
         # Simulated time to change filters
         self.filter_sleep = ValueDouble("filter_sleep", "Time to change filter [s]", writable=True, initial=1.0)
 
+        # Simulated movement in progress: target position, completion time
+        # (time.monotonic()) and whether it is a homing move
+        self._pending_filter = None
+        self._move_deadline = 0.0
+        self._move_homing = False
+        self._move_timer = None
+        self._move_lock = threading.Lock()
+
         # Centrald connection parameters
         self.centrald_host = "localhost"
         self.centrald_port = 617
@@ -44,8 +52,59 @@ class DummyFilter(Filterd):
 
     def get_filter_num(self):
         """Get current filter number."""
+        self._check_pending_move()
         return self.filter_num
 
+    def _start_move(self, new_filter, duration, homing=False):
+        """Start a simulated move, completed once duration has elapsed."""
+        deadline = time.monotonic() + duration
+        # The timer only completes the move it was started for
+        timer = threading.Timer(duration, self._check_pending_move, kwargs={'deadline': deadline})
+        timer.daemon = True
+        with self._move_lock:
+            if self._move_timer:
+                self._move_timer.cancel()
+            self._pending_filter = new_filter
+            self._move_deadline = deadline
+            self._move_homing = homing
+            self._move_timer = timer
+        timer.start()
+
+    def stop(self):
+        """Stop the device, abandoning any simulated move."""
+        with self._move_lock:
+            if self._move_timer:
+                self._move_timer.cancel()
+                self._move_timer = None
+            self._pending_filter = None
+        super().stop()
+
+    def _check_pending_move(self, deadline=None):
+        """Complete the simulated move if its deadline has passed."""
+        with self._move_lock:
+            if self._pending_filter is None:
+                return
+            if deadline is not None:
+                if deadline != self._move_deadline:
+                    return
+            elif time.monotonic() < self._move_deadline:
+                return
+            self.filter_num = self._pending_filter
+            homing = self._move_homing
+            self._pending_filter = None
+
+        if not homing:
+            self.movement_completed()
+            return
+
+        with self._filter_lock:
+            # Send updated filter value to clients
+            self.filter.value = self.filter_num
+            self.network.distribute_value_immediate(self.filter)
+
+            # Reset state and answer the client
+            self.filter_homing_completed()
+
     def set_filter_num(self, new_filter):
         """
         Set the filter number with simulated movement time.
@@ -60,13 +119,8 @@ class DummyFilter(Filterd):
         if new_filter < 0 or new_filter >= self.filter.sel_size():
             return -1
 
-        def move_filter():
-            # Simulate filter movement time
-            time.sleep(self.filter_sleep.value)
-            # Update filter position
-            self.filter_num = new_filter
-            self.movement_completed()
-        threading.Thread(target=move_filter, daemon=True).start()
+        # Simulate filter movement time without blocking the caller
+        self._start_move(new_filter, self.filter_sleep.value)
 
         # Call parent implementation to update clients
         return super().set_filter_num(new_filter)
@@ -76,35 +130,25 @@ class DummyFilter(Filterd):
         Home the filter wheel by moving to position 0.
 
         Returns:
-            0 on success, -1 on error
+            1 if homing was started; it completes once the simulated
+            homing time has elapsed. -2 if the wheel is still moving
         """
-        logging.info("Homing filter wheel")
-
-        # Set device state to show filter is moving
-        self.set_state(
-            self._state | self.FILTERD_MOVE,
-            "Homing filter wheel",
-            self.BOP_EXPOSURE
-        )
+        with self._filter_lock:
+            # Homing would cancel the running move's timer and leave it
+            # in progress until the watchdog fires
+            if self.movement_in_progress or self._pending_filter is not None:
+                logging.warning("Cannot home filter wheel while it is moving")
+                return -2
 
-        # Simulate homing operation with timeout
-        time.sleep(self.filter_sleep.value * 1.5)  # Home takes a bit longer
-
-        # Update filter position to 0 (home)
-        self.filter_num = 0
-        self.filter.value = 0
+            logging.info("Homing filter wheel")
 
-        # Send updated filter value to clients
-        self.network.distribute_value_immediate(self.filter)
+            # Set device state to show filter is moving
+            self.enter_filter_move("Homing filter wheel")
 
-        # Reset state
-        self.set_state(
-            self._state & ~self.FILTERD_MOVE,
-            "Filter wheel homed",
-            0
-        )
+            # Simulate homing operation, home takes a bit longer than a move
+            self._start_move(0, self.filter_sleep.value * 1.5, homing=True)
 
-        return 0
+        return 1
 
 
 def main():
@@ -82,7 +82,10 @@ OVIS hardware with two stepper motors:
 
 """
 
+import os
 import time
+import queue
+import select
 import logging
 import threading
 import serial
@@ -98,31 +101,123 @@ from rtspy.core.focusd import FocuserMixin
 from rtspy.core.filterd import FilterMixin
 from rtspy.core.app import App
 
+# Encoded prefixes of the motor commands taking a numeric argument
+M0_ABS = b"M 0 ABS "
+M1_ABS = b"M 1 ABS "
+M0_SPD = b"M 0 SPD "
+M0_ACC = b"M 0 ACC "
+M1_SPD = b"M 1 SPD "
+M1_ACC = b"M 1 ACC "
+
+# Default motor positions of filters 0-5 (filter 5 is the grism)
+FILTER_POSITIONS = (2000, 54500, 107000, 159500, 212000, 292000)
+
+# How far [motor steps] the wheel may stop from a filter position and
+# still count as having reached that filter
+FILTER_POSITION_TOLERANCE = 100
+
+# Time to wait for a command reply [s]; the device answers within
+# milliseconds, only homing needs (and passes) a longer timeout
+REPLY_TIMEOUT = 1.0
+
+# Status poll; it only reads the device, so it does not speed up polling
+STATUS_QUERY = b"STATUS\n"
+
+
+def _encode_command(cmd) -> bytes:
+    """Return a command (str or bytes) as newline-terminated bytes."""
+    if not isinstance(cmd, bytes):
+        cmd = cmd.encode()
+    return cmd if cmd.endswith(b'\n') else cmd + b'\n'
+
+
+class SerialCommand:
+    """A command queued for the serial I/O thread, with its reply."""
+
+    def __init__(self, payload: bytes, expect_lines: int = 0, timeout: float = REPLY_TIMEOUT,
+                 callback=None, waitable: bool = False):
+        self.payload = payload
+        self.expect_lines = expect_lines
+        self.timeout = timeout
+        self.callback = callback
+        self.response = None
+        # Only commands somebody waits for need an event to signal
+        self.done = threading.Event() if waitable else None
+
+    def wait(self):
+        """Wait for a waitable command to be processed; False on timeout."""
+        # Allow for the commands queued ahead of this one
+        return self.done.wait(self.timeout + 5.0)
+
+    def reply(self):
+        """Return the first reply line as str, None if the command failed."""
+        if self.response is None:
+            return None
+        return self.response[0].decode().strip() if self.response else ""
+
+    def complete(self):
+        """Mark the command processed and pass its reply to the callback."""
+        if self.done is not None:
+            self.done.set()
+        if self.callback is not None:
+            try:
+                self.callback(self.reply())
+            except Exception as e:
+                logging.error(f"Error in serial command callback: {e}")
+
 
 class SerialCommunicator:
     """Serial device communicator for OVIS hardware."""
 
+    # Status poll interval while motors move or a command was just sent,
+    # and while everything is idle (nothing changes then unless we send a
+    # command, the idle poll just checks the device is still there)
+    STATUS_INTERVAL = 0.25
+    IDLE_STATUS_INTERVAL = 5.0
+    # How long after a command to keep polling at full rate
+    FAST_POLL_TIME = 1.0
+
+    # Reply of the ID command
+    EXPECTED_ID = b"RPI_PICO_SPECTRAL_AVCR"
+
     def __init__(self, device_file: str, baudrate: int = 9600):
         self.device_file = device_file
         self.baudrate = baudrate
         self.serial_conn = None
-        self.connected = False
+        # Set while connected, so that others can wait for the connection
+        self._connected_event = threading.Event()
         self.status_callback = None
 
-        # Threading
-        self.running = False
+        # Bytes received from the device but not yet returned as a line
+        self._rx_buf = bytearray()
+        # Port file descriptor for direct reads, None where not available
+        self._fd = None
+        # Reusable receive buffer for direct reads, so polling does not
+        # allocate a new bytes object for every chunk
+        self._read_buf = bytearray(4096)
+        self._read_view = memoryview(self._read_buf)
+
+        # Status polling: last poll time, whether motors were moving then,
+        # and until when to poll at full rate after a command
+        self._status_ts = float('-inf')
+        self._motors_moving = False
+        self._fast_poll_until = float('-inf')
+
+        # Threading: all serial I/O is done by one thread, fed by command_queue
+        self._stop_event = threading.Event()
         self.thread = None
         self.lock = threading.RLock()
+        self.command_queue = queue.Queue()
 
     def start(self):
         """Start the communicator thread."""
         if self.thread and self.thread.is_alive():
             return True
 
-        self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(
-            target=self._status_loop,
-            name="SerialStatusLoop",
+            target=self._communication_loop,
+            name="SerialCommLoop",
             daemon=True
         )
         self.thread.start()
@@ -130,7 +225,9 @@ class SerialCommunicator:
 
     def stop(self):
         """Stop the communicator."""
-        self.running = False
+        self._stop_event.set()
+        # Wake the thread up if it waits for commands
+        self.command_queue.put(None)
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2.0)
         self._close()
@@ -145,21 +242,42 @@ class SerialCommunicator:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=5.0
+                timeout=REPLY_TIMEOUT
             )
 
+            # Ask USB-serial adapters to hand over received data immediately
+            # instead of after their latency timer (16 ms on FTDI)
+            try:
+                self.serial_conn.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+                logging.debug("Low latency mode not available on %s: %s", self.device_file, e)
+
             # Clear buffers
             self.serial_conn.reset_input_buffer()
             self.serial_conn.reset_output_buffer()
+            self._rx_buf.clear()
 
-            time.sleep(0.5)  # Wait for device to initialize
+            try:
+                self._fd = self.serial_conn.fileno()
+            except (AttributeError, OSError, ValueError):
+                self._fd = None
+
+            self._stop_event.wait(0.5)  # Wait for device to initialize
 
-            # Check device ID
-            response = self.send_command("ID", True)
-            if response != "RPI_PICO_SPECTRAL_AVCR":
-                logging.warning(f"Unknown device ID: {response}")
+            # Check device ID and get the initial status in one round trip
+            id_reply, status_reply = self._pipeline([b"ID\n", STATUS_QUERY], [1, 5])
+            response = id_reply[0] if id_reply else b''
+            if response != self.EXPECTED_ID:
+                logging.warning(f"Unknown device ID: {response!r}")
 
             self.connected = True
+
+            if status_reply and status_reply[0] and self.status_callback:
+                self._status_ts = time.monotonic()
+                try:
+                    self._process_status(status_reply)
+                except Exception as e:
+                    logging.error(f"Error updating status: {e}")
             return True
 
         except Exception as e:
@@ -167,6 +285,58 @@ class SerialCommunicator:
             self._close()
             return False
 
+    def _pipeline(self, cmds, expected_lines):
+        """
+        Send several commands in one write and read all their replies.
+
+        The device processes commands in order, so the replies come back
+        in order too. Returns a list with the reply lines of each command.
+        """
+        with self.lock:
+            self.serial_conn.write(b"".join(map(_encode_command, cmds)))
+            lines = self._readlines(sum(expected_lines))
+
+        replies = []
+        pos = 0
+        for count in expected_lines:
+            replies.append(lines[pos:pos + count])
+            pos += count
+        return replies
+
+    def _query_id(self):
+        """Ask the device for its ID on the open port."""
+        with self.lock:
+            self.serial_conn.write(b"ID\n")
+            return self._readline().rstrip()
+
+    def _ensure_connected(self):
+        """
+        Connect to the device, reusing the port if it is still open.
+
+        After a transient error the port usually stays open, so only the
+        input is resynchronised and the device asked for its ID; the port
+        is reopened only if that fails.
+        """
+        if self.connected:
+            return True
+
+        if self.serial_conn and self.serial_conn.is_open:
+            try:
+                with self.lock:
+                    self.serial_conn.reset_input_buffer()
+                    self._rx_buf.clear()
+                    response = self._query_id()
+                    if response == self.EXPECTED_ID:
+                        logging.info(f"Reconnected to {self.device_file}")
+                        self.connected = True
+                        return True
+                    logging.warning(f"Unexpected device ID on reconnect: {response!r}")
+            except (serial.SerialException, OSError) as e:
+                logging.debug("Cannot reuse serial port %s: %s", self.device_file, e)
+
+        self._close()
+        return self._connect()
+
     def _close(self):
         """Close the serial connection."""
         if self.serial_conn:
@@ -175,64 +345,248 @@ class SerialCommunicator:
             except:
                 pass
             self.serial_conn = None
+        self._rx_buf.clear()
+        self._fd = None
         self.connected = False
 
-    def send_command(self, cmd: str, expect_response: bool = False, timeout: float = 5.0):
+    def _read_chunk(self):
+        """
+        Wait up to the port timeout for data and return all that is available.
+
+        On POSIX ports this is one select() and one readv() of whatever the
+        kernel has buffered into a reusable buffer; the returned view is only
+        valid until the next call. Returns b'' on timeout.
+        """
+        fd = self._fd
+        if fd is None:
+            return self.serial_conn.read(self.serial_conn.in_waiting or 1)
+
+        ready, _, _ = select.select([fd], [], [], self.serial_conn.timeout)
+        if not ready:
+            return b''
+        n = os.readv(fd, [self._read_view])
+        if not n:
+            raise serial.SerialException("device reports readiness to read but returned no data")
+        return self._read_view[:n]
+
+    def _readline(self):
+        """
+        Read one line from the device.
+
+        Unlike Serial.readline(), which reads one byte per call, this reads
+        everything the driver already has and keeps the rest for the next line.
+        Returns what was received so far (possibly b'') on timeout.
+        """
+        buf = self._rx_buf
+        while True:
+            pos = buf.find(b'\n')
+            if pos >= 0:
+                line = bytes(buf[:pos + 1])
+                del buf[:pos + 1]
+                return line
+
+            chunk = self._read_chunk()
+            if not chunk:
+                line = bytes(buf)
+                buf.clear()
+                return line
+            buf += chunk
+
+    def _readlines(self, count):
+        """
+        Read count lines from the device, reading the reply in bulk.
+
+        Returns the stripped lines as bytes; fewer than count on timeout.
+        """
+        buf = self._rx_buf
+        while buf.count(b'\n') < count:
+            chunk = self._read_chunk()
+            if not chunk:
+                break
+            buf += chunk
+
+        lines = buf.split(b'\n', count)
+        rest = lines.pop() if len(lines) > count else b''
+        buf[:] = rest
+        if lines and not lines[-1]:
+            lines.pop()
+        return [line.strip() for line in lines]
+
+    def _submit(self, payload: bytes, expect_lines: int = 0, timeout: float = REPLY_TIMEOUT,
+                callback=None, waitable: bool = False):
+        """
+        Queue a command for the I/O thread.
+
+        Returns the SerialCommand, or None if the device is not connected.
+        Commands submitted from the I/O thread itself (e.g. from the status
+        callback) are executed right away.
+        """
+        if not self.connected:
+            return None
+
+        command = SerialCommand(payload, expect_lines, timeout, callback, waitable)
+        if threading.current_thread() is self.thread:
+            self._process_commands([command])
+        else:
+            self.command_queue.put(command)
+        return command
+
+    def send_query(self, cmd, lines: int, timeout: float = REPLY_TIMEOUT):
+        """Send a command with a multi-line reply and return the reply lines (bytes)."""
+        command = self._submit(_encode_command(cmd), lines, timeout, waitable=True)
+        if command is None or not command.wait():
+            return None
+        return command.response
+
+    def send_command(self, cmd, expect_response: bool = False, timeout: float = REPLY_TIMEOUT):
         """Send a command and optionally wait for response."""
-        if not self.serial_conn:
-            self._connect()
+        command = self._submit(_encode_command(cmd), 1 if expect_response else 0, timeout,
+                               waitable=expect_response)
+        if command is None:
+            return None
+        if not expect_response:
+            return "OK"
 
-        if not self.connected:
+        if not command.wait():
             return None
+        return command.reply()
 
-        # Add newline if needed
-        if not cmd.endswith('\n'):
-            cmd += '\n'
+    def send_command_async(self, cmd, callback, timeout: float = REPLY_TIMEOUT):
+        """
+        Send a command without waiting for its response.
+
+        callback(response) is called from the I/O thread with the response,
+        or None on failure. Returns False if the command was not queued.
+        """
+        return self._submit(_encode_command(cmd), 1, timeout, callback) is not None
+
+    def _mark_status_dirty(self):
+        """Poll status at full rate for a while after a command."""
+        self._fast_poll_until = time.monotonic() + self.FAST_POLL_TIME
+
+    def send_value(self, prefix: bytes, value, callback=None):
+        """
+        Send a command made of an encoded prefix and an integer argument.
+
+        callback(response) is called from the I/O thread once the command
+        was written ("") or failed (None).
+        """
+        if self._submit(prefix + b"%d\n" % int(value), callback=callback) is None:
+            return None
+        return "OK"
+
+    def send_commands(self, cmds):
+        """Send several commands (no responses expected) in a single write."""
+        if self._submit(b"".join(map(_encode_command, cmds))) is None:
+            return None
+        return "OK"
+
+    def _process_commands(self, commands):
+        """
+        Write a batch of queued commands at once and read back their replies.
+
+        The device answers commands in order, so the reply lines are split
+        between the commands by the number of lines each one expects.
+        """
+        payload = b"".join(c.payload for c in commands)
+        total = sum(c.expect_lines for c in commands)
 
         try:
             with self.lock:
-                self.serial_conn.write(cmd.encode())
-                self.serial_conn.flush()
-
-                if expect_response:
+                self.serial_conn.write(payload)
+                if any(c.payload != STATUS_QUERY for c in commands):
+                    self._mark_status_dirty()
+
+                lines = []
+                if total:
+                    # Changing the timeout reconfigures the port (tcsetattr),
+                    # so only do it for commands that need a non-default one
                     orig_timeout = self.serial_conn.timeout
-                    self.serial_conn.timeout = timeout
-                    try:
-                        response = self.serial_conn.readline().decode().strip()
-                        return response
-                    finally:
-                        self.serial_conn.timeout = orig_timeout
-                return "OK"
+                    timeout = max(c.timeout for c in commands if c.expect_lines)
+                    if timeout == orig_timeout:
+                        lines = self._readlines(total)
+                    else:
+                        self.serial_conn.timeout = timeout
+                        try:
+                            lines = self._readlines(total)
+                        finally:
+                            self.serial_conn.timeout = orig_timeout
+
+            pos = 0
+            for command in commands:
+                command.response = lines[pos:pos + command.expect_lines]
+                pos += command.expect_lines
         except Exception as e:
             logging.error(f"Error sending command: {e}")
             self.connected = False
-            return None
-
-    def _status_loop(self):
-        """Background thread loop to poll device status."""
-        logging.info("Status monitoring thread started")
+        finally:
+            for command in commands:
+                command.complete()
+
+    def _drain_queue(self):
+        """Take all commands queued so far off the queue."""
+        commands = []
+        while True:
+            try:
+                command = self.command_queue.get_nowait()
+            except queue.Empty:
+                return commands
+            if command is not None:
+                commands.append(command)
+
+    def _fail_pending(self):
+        """Complete all queued commands without a response."""
+        for command in self._drain_queue():
+            command.complete()
+
+    def _communication_loop(self):
+        """Background thread loop doing all serial I/O: commands and status polls."""
+        logging.info("Serial communication thread started")
         connect_retry_time = 0
 
-        while self.running:
+        while not self._stop_event.is_set():
             try:
                 # Check if we need to connect
                 if not self.connected:
+                    self._fail_pending()
                     current_time = time.time()
                     if current_time - connect_retry_time >= 5.0:
-                        self._connect()
+                        self._ensure_connected()
                         connect_retry_time = current_time
-                    time.sleep(0.1)
+                    self._stop_event.wait(0.1)
                     continue
 
-                # Get status update
-                self._update_status()
+                # Get status update, at full rate only while something
+                # may be changing on the hardware
+                now = time.monotonic()
+                fast = self._motors_moving or now < self._fast_poll_until
+                due = self._status_ts + (self.STATUS_INTERVAL if fast else self.IDLE_STATUS_INTERVAL)
+                if now >= due:
+                    self._status_ts = now
+                    self._update_status()
+                    continue
+
+                # Wait for commands until the next status check
+                try:
+                    command = self.command_queue.get(timeout=due - now)
+                except queue.Empty:
+                    continue
+                if command is None:
+                    continue
 
-                # Wait before next status check
-                time.sleep(0.25)  # 4Hz status updates
+                # Send whatever else has been queued meanwhile in the same write
+                self._process_commands([command] + self._drain_queue())
 
             except Exception as e:
-                logging.error(f"Error in status loop: {e}")
-                time.sleep(0.5)
+                logging.error(f"Error in communication loop: {e}")
+                self._stop_event.wait(0.5)
+
+        # Send commands queued before stop() (e.g. motors off)
+        if self.connected:
+            batch = self._drain_queue()
+            if batch:
+                self._process_commands(batch)
+        self._fail_pending()
 
     def _update_status(self):
         """Poll device status and pass to callback."""
@@ -240,62 +594,63 @@ class SerialCommunicator:
             return
 
         try:
-            response = self.send_command("STATUS", True)
-            if not response:
+            # STATUS replies with motor 0, motor 1, motor 2, shutter and neon lines
+            response = self.send_query(STATUS_QUERY, 5)
+            if not response or not response[0]:
                 return
-
-            # Parse motor statuses
-            motor_statuses = []
-
-            # Parse motor 0 status (focuser - first line)
-            motor_info = response.split()
-            if len(motor_info) >= 5 and motor_info[0] == "M" and motor_info[1] == "0":
-                motor_statuses.append({
-                    'motor': 0,
-                    'position': int(motor_info[2]),
-                    'is_moving': int(motor_info[3]),
-                    'speed': int(float(motor_info[4])),
-                    'acceleration': int(float(motor_info[5])) if len(motor_info) > 5 else 0
-                })
-
-            # Read motor 1 status (filter wheel - second line)
-            response = self.serial_conn.readline().decode().strip()
-            motor_info = response.split()
-            if len(motor_info) >= 5 and motor_info[0] == "M" and motor_info[1] == "1":
-                motor_statuses.append({
-                    'motor': 1,
-                    'position': int(motor_info[2]),
-                    'is_moving': int(motor_info[3]),
-                    'speed': int(float(motor_info[4])),
-                    'acceleration': int(float(motor_info[5])) if len(motor_info) > 5 else 0
-                })
-
-            # Skip motor 2, shutter status
-            self.serial_conn.readline()  # motor 2
-            self.serial_conn.readline()  # shutter
-
-            # Read neon status
-            response = self.serial_conn.readline().decode().strip()
-            neon_info = response.split()
-            neon_status = None
-            if len(neon_info) >= 2 and neon_info[0] == "R":
-                neon_status = int(neon_info[1])
-
-            # Call status callback
-            self.status_callback(motor_statuses, neon_status)
+            self._process_status(response)
 
         except Exception as e:
             logging.error(f"Error updating status: {e}")
             self.connected = False
 
+    def _process_status(self, response):
+        """Parse the STATUS reply lines and pass them to the callback."""
+        response = response + [b''] * (5 - len(response))
+
+        # Parse motor 0 (focuser) and motor 1 (filter wheel) status into
+        # {motor: (position, is_moving)}; speed and acceleration are not used
+        motor_statuses = {}
+        for motor, line in enumerate(response[:2]):
+            motor_info = line.split()
+            if len(motor_info) >= 5 and motor_info[0] == b"M" and motor_info[1] == b"%d" % motor:
+                motor_statuses[motor] = (int(motor_info[2]), int(motor_info[3]))
+
+        self._motors_moving = any(moving for _, moving in motor_statuses.values())
+
+        # Motor 2 and shutter status are not used; read neon status
+        neon_info = response[4].split()
+        neon_status = None
+        if len(neon_info) >= 2 and neon_info[0] == b"R":
+            neon_status = int(neon_info[1])
+
+        # Call status callback
+        self.status_callback(motor_statuses, neon_status)
+
     def set_status_callback(self, callback):
         """Set callback for status updates."""
         self.status_callback = callback
 
+    @property
+    def connected(self):
+        """Whether the device is connected."""
+        return self._connected_event.is_set()
+
+    @connected.setter
+    def connected(self, value):
+        if value:
+            self._connected_event.set()
+        else:
+            self._connected_event.clear()
+
     def is_connected(self):
         """Check if connected to device."""
         return self.connected
 
+    def wait_connected(self, timeout=None):
+        """Wait until connected to the device; False on timeout."""
+        return self._connected_event.wait(timeout)
+
 
 class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
     """
@@ -323,18 +678,10 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
                           help='Serial port baud rate', section='hardware')
 
         # Filter positions (hardware supports positions 0-5)
-        config.add_argument('--f0-pos', type=int, default=2000,
-                          help='Filter 0 motor position', section='filters')
-        config.add_argument('--f1-pos', type=int, default=54500,
-                          help='Filter 1 motor position', section='filters')
-        config.add_argument('--f2-pos', type=int, default=107000,
-                          help='Filter 2 motor position', section='filters')
-        config.add_argument('--f3-pos', type=int, default=159500,
-                          help='Filter 3 motor position', section='filters')
-        config.add_argument('--f4-pos', type=int, default=212000,
-                          help='Filter 4 motor position', section='filters')
-        config.add_argument('--f5-pos', type=int, default=292000,
-                          help='Filter 5 motor position (grism)', section='filters')
+        for i, pos in enumerate(FILTER_POSITIONS):
+            config.add_argument(f'--f{i}-pos', type=int, default=pos,
+                              help=f'Filter {i} motor position' + (' (grism)' if i == 5 else ''),
+                              section='filters')
 
         # Motor control options
         config.add_argument('--motor-speed', type=int, default=100000,
@@ -360,11 +707,18 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         self.serial_comm = None
 
         # Motor positions and state
-        self.motor_status_lock = threading.RLock()
+        self.motor_status_lock = threading.Lock()
 
         # Filter wheel state (from filterd_ovis.py)
         self.filter_num = 0
         self.filter_moving = False
+        # Filter the current move goes to, and the newest filter requested
+        # while the wheel was moving
+        self._pending_filter = None
+        self._queued_filter = None
+        # Set once the move command is written; status read before that
+        # still shows the wheel standing
+        self._filter_move_sent = False
         self.motor_initialized = False
 
         # OVIS-specific values (from filterd_ovis.py)
@@ -376,13 +730,19 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         self.neon.add_sel_val("off")
         self.neon.add_sel_val("on")
 
-        # Filter position values (hardware supports positions 0-5)
-        self.f0pos = ValueInteger("F0POS", "[int] filter 0 position", write_to_fits=False, writable=True, initial=2000)
-        self.f1pos = ValueInteger("F1POS", "[int] filter 1 position", write_to_fits=False, writable=True, initial=54500)
-        self.f2pos = ValueInteger("F2POS", "[int] filter 2 position", write_to_fits=False, writable=True, initial=107000)
-        self.f3pos = ValueInteger("F3POS", "[int] filter 3 position", write_to_fits=False, writable=True, initial=159500)
-        self.f4pos = ValueInteger("F4POS", "[int] filter 4 position", write_to_fits=False, writable=True, initial=212000)
-        self.f5pos = ValueInteger("F5POS", "[int] filter 5 position (grism)", write_to_fits=False, writable=True, initial=292000)
+        # Filter position values indexed by filter number (hardware supports positions 0-5)
+        self._fpos_values = tuple(
+            ValueInteger(f"F{i}POS", f"[int] filter {i} position" + (" (grism)" if i == 5 else ""),
+                         write_to_fits=False, writable=True, initial=pos)
+            for i, pos in enumerate(FILTER_POSITIONS))
+        (self.f0pos, self.f1pos, self.f2pos,
+         self.f3pos, self.f4pos, self.f5pos) = self._fpos_values
+
+        # Filter position values indexed by value name
+        self._fpos_index = {v.name: i for i, v in enumerate(self._fpos_values)}
+
+        # Driver-specific client value change handlers, keyed by value name
+        self._vc_handlers = {"NEON": self._set_neon}
 
         # Set device types for mixins
         self.focuser_type = "OVIS_FOCUSER"
@@ -407,12 +767,8 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         self.home_timeout = config.get('home_timeout', 30.0)
 
         # Apply filter positions (hardware supports positions 0-5)
-        self.f0pos.value = config.get('f0_pos', 2000)
-        self.f1pos.value = config.get('f1_pos', 54500)
-        self.f2pos.value = config.get('f2_pos', 107000)
-        self.f3pos.value = config.get('f3_pos', 159500)
-        self.f4pos.value = config.get('f4_pos', 212000)
-        self.f5pos.value = config.get('f5_pos', 292000)
+        for i, fpos in enumerate(self._fpos_values):
+            fpos.value = config.get(f'f{i}_pos', FILTER_POSITIONS[i])
 
         # Set focuser type value
         if hasattr(self, 'foc_type'):
@@ -451,36 +807,49 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
             self.serial_comm.set_status_callback(self._handle_status_update)
             self.serial_comm.start()
 
+            # Wait for the I/O thread to connect to the device
+            if not self.serial_comm.wait_connected(10.0):
+                logging.error(f"Cannot connect to {self.device_file}")
+                self.set_state(self.STATE_IDLE | self.ERROR_HW, "Cannot connect to device")
+                return
+
             # Initialize the hardware (from filterd_ovis.py)
             logging.info("Initializing OVIS multi-function device")
 
-            # Power on both motors
-            if not self.serial_comm.send_command("M 0 ON"):  # Focuser
-                logging.error("Failed to power on focuser motor")
-                self.set_state(self.STATE_IDLE | self.ERROR_HW, "Failed to power on focuser motor")
+            # Power on both motors and set their configured speed/acceleration,
+            # all in one write
+            if not self.serial_comm.send_commands([
+                    b"M 0 ON\n",  # Focuser
+                    b"M 1 ON\n",  # Filter wheel
+                    M0_SPD + b"%d" % self.motor_speed,
+                    M0_ACC + b"%d" % self.motor_acceleration,
+                    M1_SPD + b"%d" % self.motor_speed,
+                    M1_ACC + b"%d" % self.motor_acceleration]):
+                logging.error("Failed to power on motors")
+                self.set_state(self.STATE_IDLE | self.ERROR_HW, "Failed to power on motors")
                 return
 
-            if not self.serial_comm.send_command("M 1 ON"):  # Filter wheel
-                logging.error("Failed to power on filter wheel motor")
-                self.set_state(self.STATE_IDLE | self.ERROR_HW, "Failed to power on filter wheel motor")
-                return
+            # Home the filter wheel (from filterd_ovis.py); homing takes long,
+            # so initialization is finished from the I/O thread
+            logging.info("Homing filter wheel")
+            self.enter_filter_move("Homing filter wheel")
 
-            # Set configured speed/acceleration for both motors
-            self.serial_comm.send_command(f"M 0 SPD {self.motor_speed}")
-            self.serial_comm.send_command(f"M 0 ACC {self.motor_acceleration}")
-            self.serial_comm.send_command(f"M 1 SPD {self.motor_speed}")
-            self.serial_comm.send_command(f"M 1 ACC {self.motor_acceleration}")
+            if not self.serial_comm.send_command_async(b"M 1 HOM\n", self._initial_homing_done,
+                                                       self.home_timeout):
+                self._initial_homing_done(None)
 
-            # Home the filter wheel (from filterd_ovis.py)
-            logging.info("Homing filter wheel")
-            self.set_state(self._state | self.FILTERD_MOVE, "Homing filter wheel", self.BOP_EXPOSURE)
+        except Exception as e:
+            logging.error(f"Error initializing OVIS device: {e}")
+            self.set_state(self.STATE_IDLE | self.ERROR_HW, f"Initialization error: {e}")
 
-            response = self.serial_comm.send_command("M 1 HOM", True, self.home_timeout)
-            if not response or "OK" not in response:
-                logging.error("Failed to home filter wheel")
-                self.set_state(self.STATE_IDLE | self.ERROR_HW, "Failed to home filter wheel")
-                return
+    def _initial_homing_done(self, response):
+        """Finish device initialization with the M 1 HOM response."""
+        if not response or "OK" not in response:
+            logging.error("Failed to home filter wheel")
+            self.set_state(self.STATE_IDLE | self.ERROR_HW, "Failed to home filter wheel")
+            return
 
+        try:
             # Homing successful
             logging.info("Filter wheel homed successfully")
             self.filter_num = 0
@@ -507,8 +876,8 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         if self.serial_comm:
             try:
                 # Turn off both motors
-                self.serial_comm.send_command("M 0 OFF")
-                self.serial_comm.send_command("M 1 OFF")
+                self.serial_comm.send_command(b"M 0 OFF\n")
+                self.serial_comm.send_command(b"M 1 OFF\n")
             except:
                 pass
             self.serial_comm.stop()
@@ -517,62 +886,116 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
 
     def _handle_status_update(self, motor_statuses, neon_status):
         """Handle status updates from hardware."""
-        with self.motor_status_lock:
-            # Process each motor status
-            for motor in motor_statuses:
-                if motor['motor'] == 0:  # Focuser
-                    if not self.m0pos.value == motor['position']:
-                        self.m0pos.value = motor['position']
-                        self.foc_pos.value = float(motor['position'])
-
-                    # Check for focuser movement completion
-                    if (hasattr(self, '_movement_in_progress') and self._movement_in_progress and
-                        not motor['is_moving']):
-                        self._handle_focuser_movement_complete()
-
-                elif motor['motor'] == 1:  # Filter wheel
-                    if not self.m1pos.value == motor['position']:
-                        self.m1pos.value = motor['position']
-
-                    # Check for filter movement completion
-                    if self.filter_moving and not motor['is_moving']:
-                       self._handle_filter_movement_complete()
-
-            # Update neon status
-            if neon_status is not None:
-                if not self.neon.value == neon_status:
-                    self.neon.value = neon_status
-
-    def _handle_filter_movement_complete(self):
-        """Handle filter movement completion (hardware supports positions 0-5)."""
-        logging.info(f"Filter movement completed at position {self.m1pos.value}")
-
-        # Find which filter position we're closest to
-        target_positions = [
-            self.f0pos.value, self.f1pos.value, self.f2pos.value,
-            self.f3pos.value, self.f4pos.value, self.f5pos.value
-        ]
+        # Status updates only come from the I/O thread, so the values are
+        # updated without locking; the lock only guards the end of a move
+        focuser = motor_statuses.get(0)
+        if focuser is not None:
+            position, is_moving = focuser
+            if not self.m0pos.value == position:
+                self.m0pos.value = position
+                self.foc_pos.value = float(position)
+
+            # Check for focuser movement completion
+            if (hasattr(self, '_movement_in_progress') and self._movement_in_progress and
+                not is_moving):
+                self._handle_focuser_movement_complete()
 
-        closest_filter = 0
-        closest_distance = abs(self.m1pos.value - target_positions[0])
-
-        for i in range(1, len(target_positions)):
-            distance = abs(self.m1pos.value - target_positions[i])
-            if distance < closest_distance:
-                closest_distance = distance
-                closest_filter = i
+        wheel = motor_statuses.get(1)
+        if wheel is not None:
+            position, is_moving = wheel
+            if not self.m1pos.value == position:
+                self.m1pos.value = position
+
+            # Check for filter movement completion
+            if self.filter_moving and self._filter_move_sent and not is_moving:
+                # Only this thread ends a move, but a new target may be
+                # queued concurrently, so take the move state at once
+                with self.motor_status_lock:
+                    pending = self._pending_filter
+                    queued = self._queued_filter
+                    self._queued_filter = None
+                    self._filter_move_sent = False
+                self._handle_filter_movement_complete(pending, queued)
+
+        # Update neon status
+        if neon_status is not None:
+            if not self.neon.value == neon_status:
+                self.neon.value = neon_status
+
+    def _handle_filter_movement_complete(self, pending_filter, queued):
+        """
+        Handle filter movement completion (hardware supports positions 0-5).
+
+        Args:
+            pending_filter: Filter the move was sent to
+            queued: Newest filter requested during the move, or None
+        """
+        logging.info("Filter movement completed at position %s", self.m1pos.value)
+
+        # A commanded move ends at the filter it was sent to, unless the
+        # wheel stopped somewhere else
+        closest_filter = pending_filter
+        if (closest_filter is None or
+                abs(self.m1pos.value - self._fpos_values[closest_filter].value) > FILTER_POSITION_TOLERANCE):
+            if closest_filter is not None:
+                logging.warning("Filter wheel stopped at %s, away from filter %s",
+                                self.m1pos.value, closest_filter)
+            closest_filter = self._nearest_filter(self.m1pos.value)
 
         # Update filter position
         self.filter_num = closest_filter
         self.filter.value = closest_filter
 
+        # Continue to the newest filter requested during the move
+        failed_filter = None
+        if queued is not None and queued != closest_filter:
+            logging.info("Moving filter to queued position %s", queued)
+            with self.motor_status_lock:
+                self._pending_filter = queued
+            if self.serial_comm.send_value(M1_ABS, self._fpos_values[queued].value,
+                                           self._filter_move_written) is not None:
+                # The move now ends at the queued filter
+                self._target_filter = queued
+                return
+            logging.error("Cannot move filter to queued position %s", queued)
+            failed_filter = queued
+
         # Reset device state
-        self.filter_moving = False
-        self.movement_completed()
+        with self.motor_status_lock:
+            self._pending_filter = None
+        with self._filter_lock:
+            if failed_filter is not None:
+                # The wheel stays at the filter reached, and the client
+                # waiting for the queued filter gets an error
+                self._target_filter = closest_filter
+                if self.pending_filter_connection:
+                    self.network._send_error_response(self.pending_filter_connection,
+                                                      f"Cannot move filter to position {failed_filter}")
+                    self.pending_filter_connection = None
+            self.filter_moving = False
+            self.movement_completed()
+
+    def _filter_move_written(self, response):
+        """Arm move completion once the move command reached the device."""
+        if response is not None:
+            with self.motor_status_lock:
+                self._filter_move_sent = True
+
+    def _nearest_filter(self, position):
+        """Return the filter whose position is closest to a motor position."""
+        closest_filter = 0
+        closest_distance = abs(position - self._fpos_values[0].value)
+
+        for i in range(1, len(self._fpos_values)):
+            distance = abs(position - self._fpos_values[i].value)
+            if distance < closest_distance:
+                closest_distance = distance
+                closest_filter = i
+        return closest_filter
 
     def _handle_focuser_movement_complete(self):
         """Handle focuser movement completion."""
-        logging.info(f"Focuser movement completed at position {self.m0pos.value}")
+        logging.info("Focuser movement completed at position %s", self.m0pos.value)
 
         # Call the focuser mixin's end_focusing method
         self.end_focusing()
@@ -586,13 +1009,21 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
     def set_filter_num(self, new_filter):
         """Set filter wheel position (hardware supports positions 0-5)."""
         # Validate filter number
-        if new_filter < 0 or new_filter >= 6:
+        if new_filter < 0 or new_filter >= len(self._fpos_values):
             logging.error(f"Invalid filter number: {new_filter}")
             return -1
 
+        # While the wheel moves only the newest target is kept, and the
+        # wheel goes there once the current move completes
+        with self.motor_status_lock:
+            if self.filter_moving:
+                logging.info("Filter wheel moving, queueing move to position %s", new_filter)
+                self._queued_filter = new_filter
+                return 0
+
         # Check if already at this position
         if new_filter == self.filter_num:
-            logging.info(f"Filter already at position {new_filter}")
+            logging.info("Filter already at position %s", new_filter)
             return 0
 
         # Check if ready
@@ -601,34 +1032,37 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
             return -1
 
         # Get target position
-        target_positions = [
-            self.f0pos.value, self.f1pos.value, self.f2pos.value,
-            self.f3pos.value, self.f4pos.value, self.f5pos.value
-        ]
-
-        target_position = target_positions[new_filter]
-        logging.info(f"Moving filter to position {new_filter}, motor position {target_position}")
+        target_position = self._fpos_values[new_filter].value
+        logging.info("Moving filter to position %s, motor position %s", new_filter, target_position)
 
         # Update device state to show movement
-        self.set_state(
-            self._state | self.FILTERD_MOVE,
-            f"Moving to filter {new_filter}",
-            self.BOP_EXPOSURE
-        )
+        self.enter_filter_move(f"Moving to filter {new_filter}")
 
         # Mark as moving
         with self.motor_status_lock:
             self.filter_moving = True
+            self._pending_filter = new_filter
 
         # Send movement command
-        cmd = f"M 1 ABS {target_position}"
-        self.serial_comm.send_command(cmd)
+        if self.serial_comm.send_value(M1_ABS, target_position, self._filter_move_written) is None:
+            logging.error("Cannot move filter: device not connected")
+            with self.motor_status_lock:
+                self.filter_moving = False
+                self._pending_filter = None
+            self.exit_filter_move("Filter move failed")
+            return -1
 
         # Movement completion will be detected by status updates
         return 0
 
     def home_filter(self):
-        """Home the filter wheel (from filterd_ovis.py)."""
+        """
+        Home the filter wheel (from filterd_ovis.py).
+
+        Returns:
+            1 when homing was started, finished from the M 1 HOM response;
+            -1 if not connected, -2 if the command could not be queued
+        """
         if not self.serial_comm:
             logging.error("Cannot home filter: device not connected")
             return -1
@@ -636,19 +1070,21 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         logging.info("Homing filter wheel")
 
         # Set device state to show movement
-        self.set_state(
-            self._state | self.FILTERD_MOVE,
-            "Homing filter wheel",
-            self.BOP_EXPOSURE
-        )
+        self.enter_filter_move("Homing filter wheel")
 
-        # Send home command with configured timeout
-        response = self.serial_comm.send_command("M 1 HOM", True, self.home_timeout)
+        # Send home command with configured timeout; homing takes long, so
+        # the result is handled from the I/O thread
+        if not self.serial_comm.send_command_async(b"M 1 HOM\n", self._filter_homed, self.home_timeout):
+            self.mask_state(self.FILTERD_MOVE | self.ERROR_HW, self.ERROR_HW, "Homing failed", 0)
+            return -2
+        return 1
 
+    def _filter_homed(self, response):
+        """Finish filter wheel homing with the M 1 HOM response."""
         if not response or "OK" not in response:
             logging.error("Failed to home filter wheel")
-            self.set_state(self._state & ~(self.FILTERD_MOVE), "Homing failed", 0)
-            return -1
+            self.filter_homing_completed("Failed to home filter wheel")
+            return
 
         # Homing successful
         logging.info("Filter wheel homed successfully")
@@ -657,9 +1093,8 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         self.filter_num = 0
         self.filter.value = 0
 
-        # Reset state
-        self.set_state(self._state & ~(self.FILTERD_MOVE), "Filter wheel homed", 0)
-        return 0
+        # Reset state and answer the client
+        self.filter_homing_completed()
 
     # ========== FocuserMixin Implementation ==========
 
@@ -674,15 +1109,14 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
             current_pos = self.get_position()
             position_tolerance = 10.0  # Motor steps tolerance
             if abs(current_pos - position) <= position_tolerance:
-                logging.info(f"Focuser already at target position {position} (current: {current_pos})")
+                logging.info("Focuser already at target position %s (current: %s)", position, current_pos)
                 # Still need to mark movement as complete for state management
                 self._handle_focuser_movement_complete()
                 return 0
 
             # Send movement command to motor 0 (focuser)
-            cmd = f"M 0 ABS {int(position)}"
-            self.serial_comm.send_command(cmd)
-            logging.info(f"Moving focuser to position {position}")
+            self.serial_comm.send_value(M0_ABS, position)
+            logging.info("Moving focuser to position %s", position)
             return 0
         except Exception as e:
             logging.error(f"Error moving focuser: {e}")
@@ -693,7 +1127,13 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         return abs(self.get_position()) < 10.0
 
     def home_focuser(self) -> int:
-        """Home the focuser."""
+        """
+        Home the focuser.
+
+        Returns:
+            1 when homing was started, finished from the M 0 HOM response;
+            -1 if not connected, -2 if the command could not be queued
+        """
         if not self.serial_comm:
             logging.error("Cannot home focuser: device not connected")
             return -1
@@ -701,19 +1141,24 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         logging.info("Homing focuser")
 
         # Set device state to show movement
-        self.set_state(
-            self._state | self.FOC_FOCUSING,
+        self.mask_state(
+            self.FOC_FOCUSING, self.FOC_FOCUSING,
             "Homing focuser",
             self.BOP_EXPOSURE
         )
 
-        # Send home command
-        response = self.serial_comm.send_command("M 0 HOM", True, self.home_timeout)
+        # Send home command, the result is handled from the I/O thread
+        if not self.serial_comm.send_command_async(b"M 0 HOM\n", self._focuser_homed, self.home_timeout):
+            self.mask_state(self.FOC_FOCUSING | self.ERROR_HW, self.ERROR_HW, "Focuser homing failed", 0)
+            return -2
+        return 1
 
+    def _focuser_homed(self, response):
+        """Finish focuser homing with the M 0 HOM response."""
         if not response or "OK" not in response:
             logging.error("Failed to home focuser")
-            self.set_state(self._state & ~(self.FOC_FOCUSING), "Focuser homing failed", 0)
-            return -1
+            self.focuser_homing_completed("Failed to home focuser")
+            return
 
         # Homing successful
         logging.info("Focuser homed successfully")
@@ -722,9 +1167,8 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
         self.foc_pos.value = 0.0
         self.foc_tar.value = 0.0
 
-        # Reset state
-        self.set_state(self._state & ~(self.FOC_FOCUSING), "Focuser homed", 0)
-        return 0
+        # Reset state and answer the client
+        self.focuser_homing_completed()
 
     # ========== Device Methods ==========
 
@@ -753,15 +1197,14 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
     def on_value_changed_from_client(self, value, old_value, new_value):
         """Handle value changes for both functions."""
         try:
-            # Handle neon lamp (from filterd_ovis.py)
-            if value.name == "NEON":
-                self._set_neon(new_value)
+            handler = self._vc_handlers.get(value.name)
+            if handler is not None:
+                handler(new_value)
                 return 0
-            if value.name.startswith("F") and value.name.endswith("POS"):
-                filter_idx = int(value.name[1])
+            filter_idx = self._fpos_index.get(value.name)
+            if filter_idx is not None:
                 if filter_idx == self.filter.value:
-                    # Update current filter position
-                    self.serial_comm.send_command(f"M 1 ABS {new_value}")
+                    self._handle_current_filter_position_change(new_value)
                 return 0
             # Let mixins handle their values
             filter_result = FilterMixin.on_value_changed_from_client(self, value, old_value, new_value)
@@ -771,21 +1214,21 @@ class OvisMultiFunction(Device, FilterMixin, FocuserMixin):
             logging.error(f"Error handling value change: {e}")
             return -1
 
+    def _handle_current_filter_position_change(self, new_value):
+        """Move the wheel to the new position of the current filter."""
+        self.serial_comm.send_value(M1_ABS, new_value)
+
     def _set_neon(self, new_value):
         """Set neon lamp state (from filterd_ovis.py)."""
         if not self.serial_comm:
             return
 
         if new_value == 0:  # OFF
-            self.serial_comm.send_command("S ON")
-            self.serial_comm.send_command("S IN")
-            self.serial_comm.send_command("R OFF")
+            self.serial_comm.send_commands([b"S ON\n", b"S IN\n", b"R OFF\n"])
         else:  # ON
-            self.serial_comm.send_command("S ON")
-            self.serial_comm.send_command("S OUT")
-            self.serial_comm.send_command("R ON")
+            self.serial_comm.send_commands([b"S ON\n", b"S OUT\n", b"R ON\n"])
 
-        logging.info(f"Neon lamp set to {'ON' if new_value else 'OFF'}")
+        logging.info("Neon lamp set to %s", 'ON' if new_value else 'OFF')
 
 def main():
     """Main entry point for OVIS multi-function device."""
@@ -126,7 +126,7 @@ class TemperatureSensor(Device, DeviceConfig):
 
     def on_state_changed(self, old_state, new_state, message):
         """Handle device state changes."""
-        logging.info(f"State changed from {old_state:x} to {new_state:x}: {message}")
+        logging.info("State changed from %x to %x: %s", old_state, new_state, message)
 
 def main():
     """Entry point for rts2-sensor-temp daemon."""
@@ -208,7 +208,7 @@ class TemperatureSensor(Device, DeviceCaringMixin, DeviceConfig):
 
     def on_state_changed(self, old_state, new_state, message):
         """Handle device state changes."""
-        logging.info(f"State changed from {old_state:x} to {new_state:x}: {message}")
+        logging.info("State changed from %x to %x: %s", old_state, new_state, message)
 
     def on_value_changed_from_client(self, value, old_value, new_value):
         """Handle value changes from clients."""